@@ -1,22 +1,26 @@
 import argparse
-import pickle
+import csv
+import gzip
+import io
+import json
 import socket
 import time
 import uuid
-from itertools import groupby
+from functools import lru_cache
+from itertools import chain, groupby, product
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import dash_ag_grid as dag
 import dash_daq as daq
-import pandas as pd
-import plotly.graph_objects as go
-from dash import Dash, Input, Output, dcc, html
+import numpy as np
+import plotly.io as pio
+from dash import Dash, Input, Output, State, dcc, html, no_update
 from plotly import colors as plotly_colors
 
 from jobshoplab.types.instance_config_types import InstanceConfig
 from jobshoplab.types.state_types import (
-    NoTime,
     OperationStateState,
     StateMachineResult,
     TransportStateState,
@@ -24,6 +28,66 @@ from jobshoplab.types.state_types import (
 from jobshoplab.utils.exceptions import FileNotFound
 from jobshoplab.utils.logger import get_logger
 
+# Leading bytes of gzip data, used to detect compressed .lab files.
+GZIP_MAGIC = b"\x1f\x8b"
+# Leading byte of pickle data (protocol 2 and later), used to detect legacy .lab files.
+PICKLE_MAGIC = b"\x80"
+
+# Column order of the CSV export.
+CSV_COLUMNS = ["type", "id", "job", "start", "end", "meta_info"]
+
+# Above this number of bars the Gantt chart is rendered with WebGL instead of SVG.
+WEBGL_BAR_THRESHOLD = 2000
+
+# Gantt figure height and the share of each y category left empty between bars, in pixels
+# and as a fraction. PLOT_MARGIN_HEIGHT is Plotly's default top plus bottom margin.
+FIGURE_HEIGHT = 800
+PLOT_MARGIN_HEIGHT = 180
+BAR_GAP = 0.3
+
+# Sort offsets and color palettes per key prefix: jobs, machines, transports and buffers.
+SORT_OFFSETS = {"j": 0, "m": 0, "t": 1000, "b": 2000}
+COLOR_PALETTES = {
+    "j": plotly_colors.qualitative.Plotly,
+    "m": plotly_colors.qualitative.Plotly,
+    "t": plotly_colors.colorbrewer.Greys[3:],
+    "b": plotly_colors.colorbrewer.Greens,
+}
+
+# Transport states that do not show up as segments in the Gantt chart.
+HIDDEN_TRANSPORT_STATES = frozenset((TransportStateState.IDLE, TransportStateState.OUTAGE))
+
+# AG Grid filter conditions by type, applied to (cell value, filter value).
+TEXT_FILTERS = {
+    "contains": lambda value, target: target in value,
+    "notContains": lambda value, target: target not in value,
+    "equals": lambda value, target: value == target,
+    "notEqual": lambda value, target: value != target,
+    "startsWith": lambda value, target: value.startswith(target),
+    "endsWith": lambda value, target: value.endswith(target),
+}
+NUMBER_FILTERS = {
+    "equals": lambda value, target: value == target,
+    "notEqual": lambda value, target: value != target,
+    "lessThan": lambda value, target: value < target,
+    "lessThanOrEqual": lambda value, target: value <= target,
+    "greaterThan": lambda value, target: value > target,
+    "greaterThanOrEqual": lambda value, target: value >= target,
+}
+
+# Column definition options of numeric table columns. Ranges include their bounds, as in
+# matches_filter.
+NUMBER_COLUMN = {
+    "filter": "agNumberColumnFilter",
+    "filterParams": {"inRangeInclusive": True},
+}
+
+# Hover text templates per data type, filled with a row's fields.
+HOVER_TEMPLATES = {
+    "Schedule": "Typ: {type}<br>Job: {job}<br>Start: {start}<br>End: {end}<br>ID: {id}",
+    "Transport": "Typ: {type}<br>Job: {job}<br>Start: {start}<br>End: {end}<br>Route: {meta_info}",
+}
+
 # -------------------------------------------------------------------
 # Utility Classes
 # -------------------------------------------------------------------
@@ -62,22 +126,177 @@ class DashboardUtils:
             True if port is in use, False otherwise.
         """
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            return s.connect_ex(("localhost", port)) == 0
+            try:
+                s.bind(("localhost", port))
+            except OSError:
+                return True
+            return False
 
     @staticmethod
     def check_port(port: int) -> int:
         """
-        Find an available port starting from the given port.
+        Return the given port if it is available, otherwise a free port chosen by the OS.
 
         Args:
-            port: Starting port number to check.
+            port: Preferred port number.
 
         Returns:
             An available port number.
         """
-        while DashboardUtils.is_port_in_use(port):
-            port += 1
-        return port
+        if not DashboardUtils.is_port_in_use(port):
+            return port
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("localhost", 0))
+            return s.getsockname()[1]
+
+    @staticmethod
+    def dump_db(data: Dict[str, Any], num_jobs: int, num_machines: Any, current_time: int) -> bytes:
+        """
+        Encode dashboard data as a gzip-compressed JSON .lab database file.
+
+        Args:
+            data: Dictionary containing schedule, transport, and buffer data.
+            num_jobs: Number of jobs in the instance.
+            num_machines: Number of machines in the instance.
+            current_time: Current time reference.
+
+        Returns:
+            Encoded file content.
+        """
+        payload = dict(
+            data=data, num_jobs=num_jobs, num_machines=num_machines, current_time=current_time
+        )
+        encoded = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        # Level 1 removes most of the redundancy of the repeated keys at little CPU cost.
+        return gzip.compress(encoded, compresslevel=1, mtime=0)
+
+    @staticmethod
+    def load_db(file_bytes: bytes) -> Tuple[Dict[str, Any], int, Any, int]:
+        """
+        Decode a .lab database file written by dump_db.
+
+        Args:
+            file_bytes: Encoded file content.
+
+        Returns:
+            Tuple of data, number of jobs, number of machines and current time.
+
+        Raises:
+            ValueError: If the file is a legacy pickle .lab file or not a .lab file at all.
+        """
+        # Unpickling a file can execute arbitrary code, so legacy files are rejected.
+        if file_bytes[:1] == PICKLE_MAGIC:
+            raise ValueError(
+                "legacy pickle .lab files are no longer supported; re-export the schedule "
+                "by rendering it in the dashboard of the current version and downloading it"
+            )
+        if file_bytes[:2] == GZIP_MAGIC:
+            file_bytes = gzip.decompress(file_bytes)
+        if file_bytes.lstrip()[:1] != b"{":
+            raise ValueError("not a .lab file: expected gzip-compressed or plain JSON data")
+        payload = json.loads(file_bytes)
+        return (
+            payload["data"],
+            payload["num_jobs"],
+            payload["num_machines"],
+            payload["current_time"],
+        )
+
+    @staticmethod
+    def rows_to_csv(rows: Iterable[Dict[str, Any]]) -> str:
+        """
+        Encode table rows as CSV with the CSV_COLUMNS header.
+
+        Args:
+            rows: Table rows.
+
+        Returns:
+            CSV text.
+        """
+        buffer = io.StringIO()
+        writer = csv.DictWriter(
+            buffer, fieldnames=CSV_COLUMNS, extrasaction="ignore", lineterminator="\n"
+        )
+        writer.writeheader()
+        writer.writerows(rows)
+        return buffer.getvalue()
+
+    @staticmethod
+    def matches_filter(value: Any, condition: Dict[str, Any]) -> bool:
+        """
+        Check a table cell against an AG Grid column filter.
+
+        Args:
+            value: Cell value.
+            condition: Filter model of one column as sent by AG Grid.
+
+        Returns:
+            True if the value passes the filter, False otherwise.
+        """
+        if "conditions" in condition:
+            results = (DashboardUtils.matches_filter(value, c) for c in condition["conditions"])
+            return all(results) if condition.get("operator") == "AND" else any(results)
+        kind = condition.get("type")
+        if kind == "blank":
+            return value is None or value == ""
+        if kind == "notBlank":
+            return value is not None and value != ""
+        if condition.get("filterType") == "number":
+            target = condition.get("filter")
+            if kind == "inRange":
+                # A half-filled range only applies the bound that has been entered.
+                target_to = condition.get("filterTo")
+                if target is None and target_to is None:
+                    return True
+                if value is None:
+                    return False
+                return (target is None or target <= value) and (
+                    target_to is None or value <= target_to
+                )
+            # A condition without a value has not been filled in yet and filters nothing.
+            if target is None:
+                return True
+            if value is None:
+                return False
+            return NUMBER_FILTERS.get(kind, lambda a, b: True)(value, target)
+        text = "" if value is None else str(value).lower()
+        target = condition.get("filter")
+        target = "" if target is None else str(target).lower()
+        return TEXT_FILTERS.get(kind, lambda a, b: True)(text, target)
+
+    @staticmethod
+    def query_rows(
+        rows: Tuple[Dict[str, Any], ...],
+        sort_model: List[Dict[str, str]],
+        filter_model: Dict[str, Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Filter and sort table rows the way AG Grid would on the client.
+
+        Args:
+            rows: Table rows.
+            sort_model: Sorted columns in priority order, each with colId and sort direction.
+            filter_model: Filter model per column id.
+
+        Returns:
+            Filtered and sorted rows.
+        """
+        result = [
+            row
+            for row in rows
+            if all(
+                DashboardUtils.matches_filter(row.get(column), condition)
+                for column, condition in filter_model.items()
+            )
+        ]
+        # Stable sorts from the lowest to the highest priority column; None sorts first.
+        for sort in reversed(sort_model):
+            column = sort["colId"]
+            result.sort(
+                key=lambda row: (row.get(column) is not None, row.get(column)),
+                reverse=sort["sort"] == "desc",
+            )
+        return result
 
     @staticmethod
     def has_transports(data: Dict[str, Any]) -> bool:
@@ -85,21 +304,20 @@ class DashboardUtils:
         Check if the data contains transport information.
 
         Args:
-            data: Dictionary containing state data.
+            data: Dictionary containing schedule, transport, and buffer data.
 
         Returns:
-            True if transport data is present and valid, False otherwise.
+            True if there is at least one transport row, False otherwise.
         """
-        try:
-            return any(item.get("time", 0) > 0 for item in data.get("travel_times", {}).values())
-        except Exception:
-            return False
+        # Dashboard data carries no travel times, so the transport rows decide.
+        return bool(data.get("transports"))
 
 
 class DashboardDataMapper:
     """Class responsible for mapping data for dashboard visualization."""
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def map_key_to_sort(key: str) -> int:
         """
         Map component keys to sort values for consistent ordering.
@@ -110,15 +328,8 @@ class DashboardDataMapper:
         Returns:
             Integer value for sorting purposes.
         """
-        if key.startswith("j"):
-            return int(key[2:])
-        if key.startswith("m"):
-            return int(key[2:])
-        if key.startswith("t"):
-            return int(key[2:]) + 1000
-        if key.startswith("b"):
-            return int(key[2:]) + 2000
-        return 0
+        offset = SORT_OFFSETS.get(key[:1])
+        return int(key[2:]) + offset if offset is not None else 0
 
     @staticmethod
     def get_color_mapping(keys: Set[str]) -> Dict[str, str]:
@@ -132,19 +343,10 @@ class DashboardDataMapper:
             Dictionary mapping component keys to color values.
         """
         colors = {}
-        job_colors = plotly_colors.qualitative.Plotly
-        machine_colors = plotly_colors.qualitative.Plotly
-        buffer_colors = plotly_colors.colorbrewer.Greens
-        transport_colors = plotly_colors.colorbrewer.Greys[3:]
         for key in keys:
-            if key.startswith("j"):
-                colors[key] = job_colors[int(key[2:]) % len(job_colors)]
-            elif key.startswith("m"):
-                colors[key] = machine_colors[int(key[2:]) % len(machine_colors)]
-            elif key.startswith("t"):
-                colors[key] = transport_colors[int(key[2:]) % len(transport_colors)]
-            elif key.startswith("b"):
-                colors[key] = buffer_colors[int(key[2:]) % len(buffer_colors)]
+            palette = COLOR_PALETTES.get(key[:1])
+            if palette is not None:
+                colors[key] = palette[int(key[2:]) % len(palette)]
         return colors
 
     @staticmethod
@@ -158,93 +360,223 @@ class DashboardDataMapper:
         Returns:
             Formatted HTML string for hover tooltip.
         """
-        if d["type"] == "Schedule":
-            return (
-                f"Typ: {d['type']}<br>Job: {d['job']}<br>"
-                f"Start: {d['start']}<br>End: {d['end']}<br>ID: {d['id']}"
-            )
-        elif d["type"] == "Transport":
-            return (
-                f"Typ: {d['type']}<br>Job: {d['job']}<br>"
-                f"Start: {d['start']}<br>End: {d['end']}<br>Route: {d['meta_info']}"
-            )
-        return ""
+        template = HOVER_TEMPLATES.get(d["type"])
+        return template.format_map(d) if template is not None else ""
 
     @staticmethod
-    def build_figure(data: List[Dict[str, Any]], current_time: Any, axis: bool) -> go.Figure:
+    def get_template() -> Dict[str, Any]:
         """
-        Build Plotly Gantt chart figure from data.
+        Get the active Plotly layout template as a plain dictionary.
+
+        Returns:
+            Dictionary representation of the default Plotly template.
+        """
+        return pio.templates[pio.templates.default].to_plotly_json()
+
+    @staticmethod
+    def empty_figure(with_template: bool = True) -> Dict[str, Any]:
+        """
+        Build an empty figure.
+
+        Args:
+            with_template: Whether to attach the Plotly template to the layout.
+
+        Returns:
+            Plotly figure dictionary without traces.
+        """
+        layout = dict(template=DashboardDataMapper.get_template()) if with_template else {}
+        return dict(data=[], layout=layout)
+
+    @staticmethod
+    def _interleave_segments(*columns: Any, gap: Any = None) -> np.ndarray:
+        """
+        Interleave the points of every segment with gaps for a lines trace.
+
+        Args:
+            *columns: One column per point of a segment, e.g. starts, midpoints and ends.
+            gap: Gap value between segments; NaN keeps numeric points in a float array.
+
+        Returns:
+            Array of the form [a_0, b_0, ..., gap, a_1, b_1, ..., gap, ...].
+        """
+        dtype = object if gap is None else float
+        points = np.empty((len(columns[0]), len(columns) + 1), dtype=dtype)
+        for index, column in enumerate(columns):
+            points[:, index] = column
+        points[:, -1] = gap
+        return points.ravel()
+
+    @staticmethod
+    def group_bars(
+        data: List[Dict[str, Any]], axis: bool
+    ) -> Dict[Tuple[str, str], Dict[str, List[Any]]]:
+        """
+        Collect Gantt bars column-wise, one group per legend key and data type.
 
         Args:
             data: List of dictionaries containing schedule, transport, and buffer data.
-            current_time: Current time to display as vertical line.
             axis: If True, use components as y-axis; if False, use jobs as y-axis.
 
         Returns:
-            Plotly Figure object.
+            Dictionary mapping (legend key, data type) to start, end, y and hovertext
+            columns, each ordered by start time and y-axis key.
         """
-        fig = go.Figure()
         y_axis_key = "id" if axis else "job"
         legend_key = "job" if axis else "id"
-        color_mapping = DashboardDataMapper.get_color_mapping({d[legend_key] for d in data})
-        seen_legend = set()
-
+        rows_by_group: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
         # Sort data first by start time then by the chosen y-axis key.
-        data_sorted = sorted(data, key=lambda x: (x["start"], x[y_axis_key]))
-        for item in data_sorted:
-            showlegend = item[legend_key] not in seen_legend
-            seen_legend.add(item[legend_key])
-            fig.add_trace(
-                go.Bar(
-                    x=[item["end"] - item["start"]],
-                    y=[item[y_axis_key]],
-                    offsetgroup=item["type"],
-                    base=[item["start"]],
-                    name=item[legend_key],
-                    orientation="h",
-                    hovertext=DashboardDataMapper.make_hover_text(item),
-                    hoverinfo="text",
-                    showlegend=showlegend,
-                    legendgroup=item[legend_key],
-                    marker=dict(color=color_mapping.get(item[legend_key], "#000000")),
-                )
+        for item in sorted(data, key=itemgetter("start", y_axis_key)):
+            rows_by_group.setdefault((item[legend_key], item["type"]), []).append(item)
+
+        # All rows of a group share one type, so each column is extracted with a single map
+        # over the rows and the hover template is looked up once per group.
+        groups: Dict[Tuple[str, str], Dict[str, List[Any]]] = {}
+        for (name, data_type), rows in rows_by_group.items():
+            template = HOVER_TEMPLATES.get(data_type)
+            groups[(name, data_type)] = dict(
+                start=list(map(itemgetter("start"), rows)),
+                end=list(map(itemgetter("end"), rows)),
+                y=list(map(itemgetter(y_axis_key), rows)),
+                hovertext=(
+                    list(map(template.format_map, rows))
+                    if template is not None
+                    else [""] * len(rows)
+                ),
             )
+        return groups
 
-        # Add a vertical line indicating the current time.
-        fig.add_shape(
-            type="line",
-            x0=current_time,
-            y0=0,
-            x1=current_time,
-            y1=1,
-            xref="x",
-            yref="paper",
-            line=dict(color="red", width=2),
-            name="Current Time",
-            showlegend=True,
-        )
+    @staticmethod
+    def build_figure(
+        data: List[Dict[str, Any]],
+        current_time: Any,
+        axis: bool,
+        color_mapping: Optional[Dict[str, str]] = None,
+        sorted_components: Optional[List[str]] = None,
+        webgl: Optional[bool] = None,
+        groups: Optional[Dict[Tuple[str, str], Dict[str, List[Any]]]] = None,
+        with_template: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Build Plotly Gantt chart figure from data.
+
+        Args:
+            data: List of dictionaries containing schedule, transport, and buffer data.
+            current_time: Current time to display as vertical line.
+            axis: If True, use components as y-axis; if False, use jobs as y-axis.
+            color_mapping: Colors of the legend keys. Computed from data if not given.
+            sorted_components: Y-axis category order, filtered to data. Sorted from data
+                if not given.
+            webgl: Draw bars as scattergl line segments. Defaults to True above
+                WEBGL_BAR_THRESHOLD bars.
+            groups: Bar columns as returned by group_bars. Grouped from data if not given.
+            with_template: Whether to attach the Plotly template to the layout.
 
-        fig.update_xaxes(title_text="Time", overwrite=True)
-        fig.update_yaxes(title_text="Job" if not axis else "Component")
-        sorted_components = sorted(
-            {d[y_axis_key] for d in data_sorted},
-            key=lambda x: DashboardDataMapper.map_key_to_sort(x),
+        Returns:
+            Plotly figure dictionary.
+        """
+        y_axis_key = "id" if axis else "job"
+        legend_key = "job" if axis else "id"
+        if color_mapping is None:
+            color_mapping = DashboardDataMapper.get_color_mapping({d[legend_key] for d in data})
+        if groups is None:
+            groups = DashboardDataMapper.group_bars(data, axis)
+
+        present_components = {d[y_axis_key] for d in data}
+        if sorted_components is None:
+            sorted_components = sorted(present_components, key=DashboardDataMapper.map_key_to_sort)
+        else:
+            sorted_components = [c for c in sorted_components if c in present_components]
+        if webgl is None:
+            webgl = len(data) > WEBGL_BAR_THRESHOLD
+        # Keep the line segments about as thick as the bars they replace. This is approximate:
+        # the legend and axis titles also take some of the plot height.
+        category_height = (FIGURE_HEIGHT - PLOT_MARGIN_HEIGHT) / max(len(sorted_components), 1)
+        line_width = max(1, int(category_height * (1 - BAR_GAP)))
+
+        # Plain dictionaries skip the per-attribute validation of graph objects.
+        traces = []
+        # Emit the groups in legend order so the traces need no sorting afterwards. Only the
+        # first trace of each legend key gets a legend entry.
+        ordered_groups = sorted(
+            groups.items(),
+            key=lambda group: (DashboardDataMapper.map_key_to_sort(group[0][0]), group[0][0]),
         )
-        fig.update_layout(
-            yaxis=dict(categoryorder="array", categoryarray=sorted_components),
+        for name, named_groups in groupby(ordered_groups, key=lambda group: group[0][0]):
+            color = color_mapping.get(name, "#000000")
+            for index, ((_, data_type), columns) in enumerate(named_groups):
+                # Plotly serializes the numpy arrays directly.
+                base = np.asarray(columns["start"])
+                end = np.asarray(columns["end"])
+                if webgl:
+                    # Lines only register hover near their points, so every segment also
+                    # gets a midpoint. Only the midpoint carries the hover text.
+                    y = columns["y"]
+                    blank = [None] * len(y)
+                    trace = dict(
+                        type="scattergl",
+                        mode="lines",
+                        x=DashboardDataMapper._interleave_segments(
+                            base, (base + end) / 2, end, gap=np.nan
+                        ),
+                        y=DashboardDataMapper._interleave_segments(y, y, y),
+                        hovertext=DashboardDataMapper._interleave_segments(
+                            blank, columns["hovertext"], blank
+                        ),
+                        line=dict(color=color, width=line_width),
+                    )
+                else:
+                    trace = dict(
+                        type="bar",
+                        x=end - base,
+                        y=columns["y"],
+                        base=base,
+                        hovertext=columns["hovertext"],
+                        offsetgroup=data_type,
+                        orientation="h",
+                        marker=dict(color=color),
+                    )
+                trace.update(
+                    name=name,
+                    hoverinfo="text",
+                    showlegend=index == 0,
+                    legendgroup=name,
+                )
+                traces.append(trace)
+
+        layout = dict(
+            # Add a vertical line indicating the current time.
+            shapes=[
+                dict(
+                    type="line",
+                    x0=current_time,
+                    y0=0,
+                    x1=current_time,
+                    y1=1,
+                    xref="x",
+                    yref="paper",
+                    line=dict(color="red", width=2),
+                    name="Current Time",
+                    showlegend=True,
+                )
+            ],
+            xaxis=dict(title=dict(text="Time")),
+            yaxis=dict(
+                title=dict(text="Job" if not axis else "Component"),
+                categoryorder="array",
+                categoryarray=sorted_components,
+            ),
             barmode="group" if not axis else "overlay",
             bargroupgap=0,
-            bargap=0.3,
+            bargap=BAR_GAP,
             legend=dict(traceorder="normal"),
-            height=800,
+            height=FIGURE_HEIGHT,
             font=dict(family="Open Sans, sans-serif", size=14, color="black"),
+            # Keep zoom and pan when the data toggles swap the figure; reset them on an axis change.
+            uirevision="component" if axis else "job",
         )
-
-        # --- Sort the legend by reordering the traces.
-        fig.data = sorted(
-            fig.data, key=lambda trace: DashboardDataMapper.map_key_to_sort(trace.name)
-        )
-        return fig
+        if with_template:
+            layout["template"] = DashboardDataMapper.get_template()
+        return dict(data=traces, layout=layout)
 
     @staticmethod
     def map_states_to_schedule_data(
@@ -262,26 +594,23 @@ class DashboardDataMapper:
         """
         data = []
         for job in last_state.jobs:
-            active_op = next(
-                filter(
-                    lambda x: x.operation_state_state == OperationStateState.PROCESSING,
-                    job.operations,
-                ),
-                None,
-            )
-            for op in filter(
-                lambda x: x.operation_state_state == OperationStateState.DONE, job.operations
-            ):
-                data.append(
-                    {
-                        "job": job.id,
-                        "start": op.start_time.time,
-                        "end": op.end_time.time,
-                        "id": op.machine_id,
-                        "type": "Schedule",
-                        "meta_info": None,
-                    }
-                )
+            active_op = None
+            for op in job.operations:
+                if op.operation_state_state is OperationStateState.DONE:
+                    data.append(
+                        {
+                            "job": job.id,
+                            "start": op.start_time.time,
+                            "end": op.end_time.time,
+                            "id": op.machine_id,
+                            "type": "Schedule",
+                            "meta_info": None,
+                        }
+                    )
+                elif (
+                    op.operation_state_state is OperationStateState.PROCESSING and active_op is None
+                ):
+                    active_op = op
             if active_op is not None:
                 data.append(
                     {
@@ -321,52 +650,62 @@ class DashboardDataMapper:
         """
         Generate transport data in visualization-ready format.
 
+        Consecutive entries of the same transport at the same location form one segment.
+
         Args:
-            transports: List of transport objects with state information.
+            transports: List of (transport, time) tuples sorted by transport id and time.
 
         Yields:
             Dictionaries containing formatted transport data.
         """
-        for _, group in groupby(transports, lambda x: x[0].id):
-            group_list = list(group)
-            for _, sub_group in groupby(group_list, lambda x: x[0].location.location):
-                sub_group_list = list(sub_group)
-                yield DashboardDataMapper.map_transports_to_data(
-                    sub_group_list[-1][0], sub_group_list[0][1]
-                )
+        segment = None
+        first_time = None
+        last_transport = None
+        for transport, state_time in transports:
+            key = (transport.id, transport.location.location)
+            if key != segment:
+                if last_transport is not None:
+                    yield DashboardDataMapper.map_transports_to_data(last_transport, first_time)
+                segment = key
+                first_time = state_time
+            last_transport = transport
+        if last_transport is not None:
+            yield DashboardDataMapper.map_transports_to_data(last_transport, first_time)
 
     @staticmethod
     def map_states_to_transport_data(
-        history: Tuple[Any, ...], latest_time: Any
+        history: Iterable[Any], latest_time: Any
     ) -> Tuple[Dict[str, Any], ...]:
         """
         Extract transport data from state machine history.
 
         Args:
-            history: Tuple of state machine results.
+            history: Iterable of states; it is consumed in a single pass.
             latest_time: The latest time in the state machine history.
 
         Returns:
             Tuple of dictionaries containing transport data.
         """
-        transport_states = ((tran, h.time.time) for h in history for tran in h.transports)
-        transports = filter(
-            lambda x: x[0].state not in [TransportStateState.IDLE, TransportStateState.OUTAGE],
-            transport_states,
+        transports = sorted(
+            (
+                (tran, h.time.time)
+                for h in history
+                for tran in h.transports
+                if tran.state not in HIDDEN_TRANSPORT_STATES
+            ),
+            key=lambda x: (DashboardDataMapper.map_key_to_sort(x[0].id), x[1]),
         )
-        transports = sorted(tuple(transports), key=lambda x: (int(x[0].id[2:]), x[1]))
-        transport_list = list(DashboardDataMapper.make_transport_data(transports))
-        return tuple(transport_list)
+        return tuple(DashboardDataMapper.make_transport_data(transports))
 
     @staticmethod
     def map_states_to_buffer_data(
-        history: Tuple[Any, ...], latest_time: Any
+        history: Iterable[Any], latest_time: Any
     ) -> Tuple[Dict[str, Any], ...]:
         """
         Extract buffer data from state machine history.
 
         Args:
-            history: Tuple of state machine results.
+            history: Iterable of states.
             latest_time: The latest time in the state machine history.
 
         Returns:
@@ -386,13 +725,29 @@ class DashboardDataMapper:
         Returns:
             The latest time value from operations.
         """
+        # Unset end times (NoTime) carry None as time.
         return max(
             op.end_time.time
             for job in last_state.jobs
             for op in job.operations
-            if op.end_time != NoTime()
+            if op.end_time.time is not None
         )
 
+    @staticmethod
+    def iter_all_states(history: Iterable[Any]) -> Iterator[Any]:
+        """
+        Lazily yield the sub-states and the resulting state of every history entry.
+
+        Args:
+            history: Iterable of state machine results.
+
+        Yields:
+            States in history order, each result's sub-states before its state.
+        """
+        for h in history:
+            yield from h.sub_states
+            yield h.state
+
     @staticmethod
     def add_sub_states_to_history(history: Tuple[Any, ...]) -> Tuple[Any, ...]:
         """
@@ -404,11 +759,7 @@ class DashboardDataMapper:
         Returns:
             Tuple of states including sub-states.
         """
-        all_states = []
-        for h in history:
-            all_states.extend(list(h.sub_states))
-            all_states.append(h.state)
-        return tuple(all_states)
+        return tuple(DashboardDataMapper.iter_all_states(history))
 
     @staticmethod
     def map_states_to_gant_data(history: Tuple[Any, ...]) -> Dict[str, Tuple[Dict[str, Any], ...]]:
@@ -421,11 +772,17 @@ class DashboardDataMapper:
         Returns:
             Dictionary containing schedules, transports, and buffer data.
         """
-        all_history = DashboardDataMapper.add_sub_states_to_history(history)
-        latest_time = DashboardDataMapper.get_latest_time(all_history[-1])
-        schedules = DashboardDataMapper.map_states_to_schedule_data(all_history[-1], latest_time)
-        transports = DashboardDataMapper.map_states_to_transport_data(all_history, latest_time)
-        buffer_data = DashboardDataMapper.map_states_to_buffer_data(all_history, latest_time)
+        # Every result ends with its own state, so the last state needs no flattened copy.
+        last_state = history[-1].state
+        # The clock of the final state is known already; no need to rescan its operations.
+        latest_time = last_state.time.time
+        schedules = DashboardDataMapper.map_states_to_schedule_data(last_state, latest_time)
+        transports = DashboardDataMapper.map_states_to_transport_data(
+            DashboardDataMapper.iter_all_states(history), latest_time
+        )
+        buffer_data = DashboardDataMapper.map_states_to_buffer_data(
+            DashboardDataMapper.iter_all_states(history), latest_time
+        )
         return {"schedules": schedules, "transports": transports, "buffer": buffer_data}
 
 
@@ -446,7 +803,15 @@ class JobShopDashboard:
         has_transports: Boolean indicating if transport data is present.
         debug: Boolean flag for debug mode.
         port: Port number for the dashboard server.
+        resolved_port: Port the dashboard serves on, chosen on the first run.
+        use_webgl: Whether to draw the Gantt bars with WebGL.
         logger: Logger instance.
+        rows: Schedule, transport, and buffer rows combined.
+        color_mappings: Legend colors per axis toggle state.
+        sorted_components: Y-axis category order per axis toggle state.
+        figures_json: Figure parts sent to the browser (see load_figures).
+        table_cache: Last table query and its filtered and sorted rows.
+        csv_text: CSV export of the rows.
         app: Dash application instance.
     """
 
@@ -459,6 +824,7 @@ class JobShopDashboard:
         has_transports: bool,
         debug: bool,
         port: int,
+        use_webgl: Optional[bool] = None,
     ) -> None:
         """
         Initialize the JobShopDashboard.
@@ -471,6 +837,8 @@ class JobShopDashboard:
             has_transports: Boolean indicating if transport data is present.
             debug: Boolean flag for debug mode.
             port: Port number for the dashboard server.
+            use_webgl: Draw the Gantt bars with WebGL (True) or SVG (False). Defaults to
+                True above WEBGL_BAR_THRESHOLD bars in total.
         """
         self.data = data
         self.num_machines = num_machines
@@ -479,19 +847,39 @@ class JobShopDashboard:
         self.has_transports = has_transports
         self.debug = debug
         self.port = port
+        self.resolved_port: Optional[int] = None
         self.logger = get_logger("JobShopDashboard", "INFO")
+        self.rows = tuple(chain(data["schedules"], data["transports"], data["buffer"]))
+        # Decided once for all figures, so toggling a data kind never swaps the renderer.
+        self.use_webgl = len(self.rows) > WEBGL_BAR_THRESHOLD if use_webgl is None else use_webgl
+        # Legend keys are jobs on the component axis and components on the job axis.
+        self.color_mappings = {
+            axis: DashboardDataMapper.get_color_mapping(
+                {row["job" if axis else "id"] for row in self.rows}
+            )
+            for axis in (False, True)
+        }
+        self.sorted_components = {
+            axis: sorted(
+                {row["id" if axis else "job"] for row in self.rows},
+                key=DashboardDataMapper.map_key_to_sort,
+            )
+            for axis in (False, True)
+        }
+        self.figures_json: Optional[str] = None
+        self.table_cache: Optional[Tuple[str, List[Dict[str, Any]]]] = None
+        self.csv_text: Optional[str] = None
 
         # Generate unique IDs for every interactive component.
-        self.store_data_id = f"store-data-{uuid.uuid4().hex}"
-        self.store_current_time_id = f"store-current_time-{uuid.uuid4().hex}"
-        self.store_num_machines_id = f"store-num_machines-{uuid.uuid4().hex}"
-        self.store_num_jobs_id = f"store-num_jobs-{uuid.uuid4().hex}"
+        self.store_figures_id = f"store-figures-{uuid.uuid4().hex}"
         self.graph_id = f"gantt-{uuid.uuid4().hex}"
         self.show_transport_id = f"show_transport-{uuid.uuid4().hex}"
         self.show_schedules_id = f"show_schedules-{uuid.uuid4().hex}"
         self.show_buffer_id = f"show_buffer-{uuid.uuid4().hex}"
         self.axis_toggle_id = f"axis_toggle-{uuid.uuid4().hex}"
         self.schedule_table_id = f"schedule_table-{uuid.uuid4().hex}"
+        self.table_details_id = f"table_details-{uuid.uuid4().hex}"
+        self.table_container_id = f"table_container-{uuid.uuid4().hex}"
         self.download_btn_id = f"download_btn-{uuid.uuid4().hex}"
         self.download_db_id = f"download_db-{uuid.uuid4().hex}"
         self.download_csv_btn_id = f"download_csv_btn-{uuid.uuid4().hex}"
@@ -503,17 +891,10 @@ class JobShopDashboard:
 
     def _setup_layout(self) -> None:
         """Set up the layout for the Dash application."""
-        table_data = [
-            dict(item)
-            for item in self.data["schedules"] + self.data["transports"] + self.data["buffer"]
-        ]
-
         self.app.layout = html.Div(
             [
-                dcc.Store(id=self.store_data_id, data=self.data),
-                dcc.Store(id=self.store_current_time_id, data=self.current_time),
-                dcc.Store(id=self.store_num_machines_id, data=self.num_machines),
-                dcc.Store(id=self.store_num_jobs_id, data=self.num_jobs),
+                # Filled after the page has loaded (see load_figures).
+                dcc.Store(id=self.store_figures_id),
                 html.H1(
                     f"JobShopLab Dashboard for {self.num_machines[0]} machines and {self.num_jobs} jobs",
                     style={
@@ -523,13 +904,15 @@ class JobShopDashboard:
                         "margin-bottom": "6px",
                     },
                 ),
-                dcc.Graph(
-                    id=self.graph_id,
-                    style={
-                        "font-size": "14px",
-                        "font-family": "Roboto, arial",
-                        "margin-bottom": "12px",
-                    },
+                dcc.Loading(
+                    dcc.Graph(
+                        id=self.graph_id,
+                        style={
+                            "font-size": "14px",
+                            "font-family": "Roboto, arial",
+                            "margin-bottom": "12px",
+                        },
+                    ),
                 ),
                 html.Div(
                     [
@@ -580,68 +963,22 @@ class JobShopDashboard:
                     ],
                     style={"display": "flex", "justify-content": "center", "margin-bottom": "46px"},
                 ),
-                html.Div(
+                html.Details(
                     [
-                        dag.AgGrid(
-                            id="schedule-table",
-                            columnDefs=[
-                                {
-                                    "field": "id",
-                                    "headerName": "ID",
-                                },
-                                {"field": "job", "headerName": "Job"},
-                                {"field": "start", "headerName": "Start"},
-                                {"field": "end", "headerName": "End"},
-                                {
-                                    "field": "meta_info",
-                                    "headerName": "Meta Info",
-                                },
-                            ],
-                            rowData=table_data,
-                            # rowSelection="multiple",  # Enable multi-row selection
-                            defaultColDef={
-                                "sortable": True,
-                                "filter": True,
-                                "resizable": True,
-                                "cellStyle": {
-                                    "textAlign": "center",
-                                    "fontSize": "14px",
-                                    "fontFamily": "Roboto, arial",
-                                },
-                                # "checkboxSelection": {
-                                #     "function": "params.column == params.columnApi.getAllDisplayedColumns()[0]"
-                                # },
-                                # "headerCheckboxSelection": {
-                                #     "function": "params.column == params.columnApi.getAllDisplayedColumns()[0]"
-                                # },
-                            },
-                            dashGridOptions={
-                                "pagination": True,
-                                "paginationPageSize": 12,
-                                "rowSelection": "multiple",
-                                "suppressRowClickSelection": True,
-                                "animateRows": False,
-                            },
-                            className="ag-theme-balham",
+                        html.Summary(
+                            "Schedule Table",
                             style={
-                                "padding": "auto",
-                                "height": "400px",
-                                "width": "1012px",
-                                "justify-content": "center",
-                                "font-size": "14px",
+                                "cursor": "pointer",
+                                "font-size": "16px",
                                 "font-family": "Roboto, arial",
+                                "margin-bottom": "12px",
                             },
-                        )
+                        ),
+                        # Mounted the first time the section is opened (see mount_table).
+                        html.Div(id=self.table_container_id),
                     ],
-                    style={
-                        "display": "flex",
-                        "justify-content": "center",  # Centers the table horizontally
-                        "alignItems": "center",
-                        "margin-bottom": "12px",
-                        "font-size": "14px",
-                        "font-family": "Roboto, arial",
-                        "width": "100%",
-                    },
+                    id=self.table_details_id,
+                    open=False,
                 ),
                 html.Div(
                     [
@@ -711,45 +1048,255 @@ class JobShopDashboard:
                 "padding": "20px",
             },
         )
+        # The table is mounted later, so callback validation has to know about it up front.
+        self.app.validation_layout = html.Div([self.app.layout, self._schedule_table()])
         self.app.title = "JobShopLab Dashboard"
 
+    def _schedule_table(self) -> html.Div:
+        """
+        Build the schedule table, mounted once its section is opened.
+
+        Returns:
+            Container with the AG Grid table.
+        """
+        return html.Div(
+            [
+                dag.AgGrid(
+                    id=self.schedule_table_id,
+                    columnDefs=[
+                        {
+                            "field": "id",
+                            "headerName": "ID",
+                        },
+                        {"field": "job", "headerName": "Job"},
+                        {
+                            "field": "start",
+                            "headerName": "Start",
+                            **NUMBER_COLUMN,
+                        },
+                        {
+                            "field": "end",
+                            "headerName": "End",
+                            **NUMBER_COLUMN,
+                        },
+                        {
+                            "field": "meta_info",
+                            "headerName": "Meta Info",
+                        },
+                    ],
+                    # Rows are fetched block by block (see get_rows).
+                    rowModelType="infinite",
+                    # rowSelection="multiple",  # Enable multi-row selection
+                    defaultColDef={
+                        "sortable": True,
+                        "filter": True,
+                        "resizable": True,
+                        "cellStyle": {
+                            "textAlign": "center",
+                            "fontSize": "14px",
+                            "fontFamily": "Roboto, arial",
+                        },
+                        # "checkboxSelection": {
+                        #     "function": "params.column == params.columnApi.getAllDisplayedColumns()[0]"
+                        # },
+                        # "headerCheckboxSelection": {
+                        #     "function": "params.column == params.columnApi.getAllDisplayedColumns()[0]"
+                        # },
+                    },
+                    dashGridOptions={
+                        "pagination": True,
+                        "paginationPageSize": 12,
+                        "rowSelection": "multiple",
+                        "suppressRowClickSelection": True,
+                        "animateRows": False,
+                    },
+                    className="ag-theme-balham",
+                    style={
+                        "padding": "auto",
+                        "height": "400px",
+                        "width": "1012px",
+                        "justify-content": "center",
+                        "font-size": "14px",
+                        "font-family": "Roboto, arial",
+                    },
+                )
+            ],
+            style={
+                "display": "flex",
+                "justify-content": "center",  # Centers the table horizontally
+                "alignItems": "center",
+                "margin-bottom": "12px",
+                "font-size": "14px",
+                "font-family": "Roboto, arial",
+                "width": "100%",
+            },
+        )
+
     def _register_callbacks(self) -> None:
         """Register callback functions for Dash application interactivity."""
 
+        # The page renders first; the figures are built and sent once it has loaded.
         @self.app.callback(
+            Output(self.store_figures_id, "data"),
+            Input(self.store_figures_id, "id"),
+        )
+        def load_figures(_):
+            return self.load_figures()
+
+        # The figure for the toggle states is composed from the parts in the browser.
+        self.app.clientside_callback(
+            """
+            function(parts, showTransport, showSchedules, showBuffer, axis) {
+                if (!parts) {
+                    return window.dash_clientside.no_update;
+                }
+                // The parts arrive as a JSON string; parse them once per page.
+                const cache = (window.jobshoplabFigures = window.jobshoplabFigures || new Map());
+                if (!cache.has(parts)) {
+                    cache.set(parts, { parsed: JSON.parse(parts), figures: new Map() });
+                }
+                const entry = cache.get(parts);
+                const parsed = entry.parsed;
+                const axisKey = axis ? "1" : "0";
+                // Kinds without data have no part and do not change the figure.
+                const keys = [
+                    ["transports", showTransport],
+                    ["schedules", showSchedules],
+                    ["buffer", showBuffer],
+                ]
+                    .filter(([kind, show]) => show && parsed.figures[kind + axisKey])
+                    .map(([kind]) => kind + axisKey);
+                const key = keys.join(",");
+                if (key === entry.shown) {
+                    return window.dash_clientside.no_update;
+                }
+                entry.shown = key;
+                if (!entry.figures.has(key)) {
+                    entry.figures.set(key, composeFigure(parsed, keys, axisKey));
+                }
+                return entry.figures.get(key);
+
+                function composeFigure(parsed, keys, axisKey) {
+                    if (!keys.length) {
+                        return { data: [], layout: { template: parsed.template } };
+                    }
+                    const parts = keys.map((key) => parsed.figures[key]);
+                    const legend = parsed.legend[axisKey];
+                    const rank = new Map(legend.map((name, index) => [name, index]));
+                    const present = new Set(parts.flatMap((p) => p.layout.yaxis.categoryarray));
+                    const categories = parsed.categories[axisKey].filter((c) => present.has(c));
+                    // Same line width as build_figure for the categories shown.
+                    const height = parsed.plotHeight / Math.max(categories.length, 1);
+                    const width = Math.max(1, Math.floor(height * (1 - parsed.barGap)));
+                    const named = new Set();
+                    // Array.prototype.sort is stable, so each legend key keeps the kind order.
+                    const data = parts
+                        .flatMap((part) => part.data)
+                        .sort((a, b) => rank.get(a.name) - rank.get(b.name))
+                        .map((trace) => {
+                            const showlegend = !named.has(trace.name);
+                            named.add(trace.name);
+                            const composed = { ...trace, showlegend };
+                            if (trace.line) {
+                                composed.line = { ...trace.line, width };
+                            }
+                            return composed;
+                        });
+                    const layout = parts[0].layout;
+                    return {
+                        data,
+                        layout: {
+                            ...layout,
+                            yaxis: { ...layout.yaxis, categoryarray: categories },
+                            template: parsed.template,
+                        },
+                    };
+                }
+            }
+            """,
             Output(self.graph_id, "figure"),
-            Input(self.store_data_id, "data"),
-            Input(self.store_current_time_id, "data"),
+            Input(self.store_figures_id, "data"),
             Input(self.show_transport_id, "on"),
             Input(self.show_schedules_id, "on"),
             Input(self.show_buffer_id, "on"),
             Input(self.axis_toggle_id, "value"),
         )
-        def update_fig(data, current_time, show_transport, show_schedules, show_buffer, axis):
-            return self.update_fig(
-                data, current_time, show_transport, show_schedules, show_buffer, axis
-            )
+
+        @self.app.callback(
+            Output(self.table_container_id, "children"),
+            Input(self.table_details_id, "open"),
+            State(self.table_container_id, "children"),
+            prevent_initial_call=True,
+        )
+        def mount_table(is_open, children):
+            # Mount once; the grid keeps its state when the section is closed and reopened.
+            if not is_open or children:
+                return no_update
+            return self._schedule_table()
+
+        @self.app.callback(
+            Output(self.schedule_table_id, "getRowsResponse"),
+            Input(self.schedule_table_id, "getRowsRequest"),
+            prevent_initial_call=True,
+        )
+        def get_rows(request):
+            return self.get_rows(request)
 
         @self.app.callback(
             Output(self.download_db_id, "data"),
-            Input(self.store_data_id, "data"),
-            Input(self.store_current_time_id, "data"),
-            Input(self.store_num_jobs_id, "data"),
-            Input(self.store_num_machines_id, "data"),
             Input(self.download_btn_id, "n_clicks"),
             prevent_initial_call=True,
         )
-        def download_db(data, current_time, num_jobs, num_machines, n_clicks):
-            return self.download_db(data, current_time, num_jobs, num_machines, n_clicks)
+        def download_db(n_clicks):
+            return self.download_db()
 
         @self.app.callback(
             Output(self.download_csv_id, "data"),
-            Input(self.store_data_id, "data"),
             Input(self.download_csv_btn_id, "n_clicks"),
             prevent_initial_call=True,
         )
-        def download_csv(data, n_clicks):
-            return self.download_csv(data, n_clicks)
+        def download_csv(n_clicks):
+            return self.download_csv()
+
+    def load_figures(self) -> str:
+        """
+        Build and encode the figure parts on the first page load.
+
+        Returns:
+            JSON string with one figure per data kind and axis, the category and legend
+            order per axis, the line width inputs and the template.
+        """
+        if self.figures_json is None:
+            figures = {}
+            for kind, axis in product(("transports", "schedules", "buffer"), (False, True)):
+                if self.data[kind]:
+                    figures[f"{kind}{int(axis)}"] = DashboardDataMapper.build_figure(
+                        self.data[kind],
+                        self.current_time,
+                        axis,
+                        self.color_mappings[axis],
+                        self.sorted_components[axis],
+                        webgl=self.use_webgl,
+                        with_template=False,
+                    )
+            legend = {
+                str(int(axis)): sorted(
+                    {row["job" if axis else "id"] for row in self.rows},
+                    key=lambda key: (DashboardDataMapper.map_key_to_sort(key), key),
+                )
+                for axis in (False, True)
+            }
+            self.figures_json = pio.json.to_json_plotly(
+                dict(
+                    figures=figures,
+                    categories={str(int(axis)): c for axis, c in self.sorted_components.items()},
+                    legend=legend,
+                    plotHeight=FIGURE_HEIGHT - PLOT_MARGIN_HEIGHT,
+                    barGap=BAR_GAP,
+                    template=DashboardDataMapper.get_template(),
+                )
+            )
+        return self.figures_json
 
     def update_fig(
         self,
@@ -759,7 +1306,7 @@ class JobShopDashboard:
         show_schedules: bool,
         show_buffer: bool,
         axis: bool,
-    ) -> go.Figure:
+    ) -> Dict[str, Any]:
         """
         Update the Gantt chart figure based on user selections.
 
@@ -772,68 +1319,87 @@ class JobShopDashboard:
             axis: If True, use components as y-axis; if False, use jobs as y-axis.
 
         Returns:
-            Updated Plotly Figure object.
+            Updated Plotly figure dictionary.
         """
-        try:
-            filtered_data = []
-            if show_transport:
-                filtered_data += data["transports"]
-            if show_schedules:
-                filtered_data += data["schedules"]
-            if show_buffer:
-                filtered_data += data["buffer"]
-            if not filtered_data:
-                return go.Figure()
-            return DashboardDataMapper.build_figure(filtered_data, current_time, axis)
-        except Exception as e:
-            self.logger.error(f"Error updating figure: {e}")
-            return go.Figure()
+        shown = [
+            kind
+            for kind, show in (
+                ("transports", show_transport),
+                ("schedules", show_schedules),
+                ("buffer", show_buffer),
+            )
+            if show and data[kind]
+        ]
+        if not shown:
+            return DashboardDataMapper.empty_figure()
+        filtered_data = []
+        groups = {}
+        for kind in shown:
+            filtered_data += data[kind]
+            groups.update(DashboardDataMapper.group_bars(data[kind], bool(axis)))
+        return DashboardDataMapper.build_figure(
+            filtered_data,
+            current_time,
+            axis,
+            self.color_mappings[bool(axis)],
+            self.sorted_components[bool(axis)],
+            webgl=self.use_webgl,
+            groups=groups,
+        )
 
-    def download_db(
-        self,
-        data: Dict[str, Any],
-        current_time: int,
-        num_jobs: int,
-        num_machines: Tuple[int],
-        n_clicks: int,
-    ) -> Optional[Dict[str, Any]]:
+    def get_rows(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Prepare dashboard data for download in binary format.
+        Provide one block of table rows for the AG Grid infinite row model.
 
         Args:
-            data: Dictionary containing schedule, transport, and buffer data.
-            current_time: Current time reference.
-            num_jobs: Number of jobs in the instance.
-            num_machines: Tuple containing the number of machines.
-            n_clicks: Number of times the download button has been clicked.
+            request: Block request with startRow, endRow, sortModel and filterModel.
+
+        Returns:
+            Dictionary with the requested rowData and the total rowCount.
+        """
+        query = json.dumps(
+            [request.get("sortModel", []), request.get("filterModel", {})], sort_keys=True
+        )
+        # Callbacks may run concurrently; read and replace the cache as one tuple.
+        cache = self.table_cache
+        if cache is not None and cache[0] == query:
+            rows = cache[1]
+        else:
+            rows = DashboardUtils.query_rows(
+                self.rows, request.get("sortModel", []), request.get("filterModel", {})
+            )
+            self.table_cache = (query, rows)
+        return dict(rowData=rows[request["startRow"] : request["endRow"]], rowCount=len(rows))
+
+    def download_db(self) -> Optional[Dict[str, Any]]:
+        """
+        Prepare dashboard data for download as a .lab database file.
 
         Returns:
             Dictionary containing download data or None if an error occurs.
         """
         try:
-            file_bytes = pickle.dumps((data, num_jobs, num_machines, current_time))
+            file_bytes = DashboardUtils.dump_db(
+                self.data, self.num_jobs, self.num_machines, self.current_time
+            )
             return dcc.send_bytes(file_bytes, "dashboard_db.lab")
-        except Exception as e:
+        except (TypeError, ValueError) as e:
             self.logger.error(f"Error preparing file download: {e}")
             return None
 
-    def download_csv(
-        self, data: Dict[str, List[Dict[str, Any]]], n_clicks: int
-    ) -> Optional[Dict[str, Any]]:
+    def download_csv(self) -> Optional[Dict[str, Any]]:
         """
         Prepare dashboard data for download in CSV format.
 
-        Args:
-            data: Dictionary containing schedule, transport, and buffer data.
-            n_clicks: Number of times the download button has been clicked.
-
         Returns:
             Dictionary containing download data or None if an error occurs.
         """
         try:
-            df = pd.DataFrame(data["schedules"] + data["transports"] + data["buffer"])
-            return dcc.send_data_frame(df.to_csv, "dashboard_data.csv")
-        except Exception as e:
+            # The rows never change, so the CSV is encoded on the first download only.
+            if self.csv_text is None:
+                self.csv_text = DashboardUtils.rows_to_csv(self.rows)
+            return dcc.send_string(self.csv_text, "dashboard_data.csv")
+        except (csv.Error, ValueError) as e:
             self.logger.error(f"Error preparing CSV download: {e}")
             return None
 
@@ -845,11 +1411,14 @@ class JobShopDashboard:
             Exception: If dashboard fails to launch.
         """
         try:
-            port = DashboardUtils.check_port(self.port)
+            # Resolved on the first run only; a later run (e.g. re-executing a notebook cell)
+            # reuses the port this dashboard already serves on instead of probing again.
+            if self.resolved_port is None:
+                self.resolved_port = DashboardUtils.check_port(self.port)
             self.app.run(
                 debug=self.debug,
                 use_reloader=False,
-                port=port,
+                port=self.resolved_port,
                 jupyter_height=1500,
                 jupyter_mode="inline",
             )
@@ -877,7 +1446,7 @@ def start_dashboard_from_file(file_path: str, debug: bool, port: int) -> None:
     logger = get_logger("FileLoad", "INFO")
     try:
         with open(path, "rb") as f:
-            data, num_jobs, num_machines, current_time = pickle.load(f)
+            data, num_jobs, num_machines, current_time = DashboardUtils.load_db(f.read())
     except Exception as e:
         logger.error(f"Error loading file {file_path}: {e}")
         raise
@@ -920,7 +1489,7 @@ def render_in_dashboard(
     num_machines = (len(history[-1].state.machines),)
     num_jobs = len(history[-1].state.jobs)
     current_time = history[-1].state.time.time
-    has_transports = any(tt.time > 0 for tt in instance.logistics.travel_times.values())
+    has_transports = DashboardUtils.has_transports(data)
     dashboard = JobShopDashboard(
         data, num_machines, num_jobs, current_time, has_transports, debug, port
     )
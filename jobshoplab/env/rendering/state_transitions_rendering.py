@@ -1,7 +1,6 @@
-from functools import partial
-
-import matplotlib.pyplot as plt
-import networkx as nx
+import math
+import pickle
+from functools import lru_cache, partial
 
 from jobshoplab.state_machine.core.transitions import (
     BufferTransition,
@@ -9,60 +8,141 @@ from jobshoplab.state_machine.core.transitions import (
     TransportTransition,
 )
 
+# The transition tables are static, so the validators are created once at import.
+TRANSITIONS = (BufferTransition(), TransportTransition(), MachineTransition())
 
-def render_state_transitions(config, loglevel, backend):
+
+def circular_positions(states):
     """
-    Render the state transitions.
+    Place states evenly on the unit circle, starting at (1, 0) and going counterclockwise.
+
+    This is the layout nx.circular_layout would produce, without building numpy arrays for a
+    handful of nodes.
 
     Args:
-        config (Config): The configuration object.
-        loglevel (int | str): The log level
-        backend (callable): The backend to use for rendering.
+        states (Sequence[str]): The states in drawing order.
+
+    Returns:
+        dict[str, tuple[float, float]]: The position of every state.
+    """
+    step = 2 * math.pi / len(states)
+    return {state: (math.cos(i * step), math.sin(i * step)) for i, state in enumerate(states)}
+
+
+def transition_graphs():
+    """
+    Collect what is drawn for the buffer, transport and machine transition graphs.
+
+    Returns:
+        tuple: One (title, positions, edges) triple per graph. positions holds
+            (state, (x, y)) pairs in drawing order, edges holds (source, target) pairs.
+    """
+    return tuple(
+        (
+            transition.__class__.__name__,
+            tuple(circular_positions(transition.states).items()),
+            tuple(
+                (node, edge) for node in transition.states for edge in transition.transitions[node]
+            ),
+        )
+        for transition in TRANSITIONS
+    )
+
+
+@lru_cache(maxsize=1)
+def _pickled_state_transition_figure():
+    """
+    Draw the buffer, transport and machine transition graphs side by side.
+
+    Returns:
+        bytes: The pickled figure with one axis per transition graph.
     """
-    graph = []
+    # matplotlib is only needed when the graphs are actually drawn, so importing this module
+    # stays cheap.
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
 
-    fig, axs = plt.subplots(1, 3, figsize=(15, 5))
+    # The figure is only handed to the backend, never shown, so it is drawn on a plain Agg
+    # canvas. This avoids the (possibly interactive) pyplot backend and its figure registry.
+    fig = Figure(figsize=(15, 5))
+    FigureCanvasAgg(fig)
+    axs = fig.subplots(1, 3)
 
-    for i, transition in enumerate(
-        [BufferTransition(), TransportTransition(), MachineTransition()]
-    ):
-        G = nx.DiGraph()
-        for node in transition.states:
-            G.add_node(node, label=node)  # Add node with label
-            _trans = transition.transitions[node]
-            for edge in _trans:
-                G.add_edge(node, edge, label=edge)  # Add edge with label
+    for ax, (title, positions, edges) in zip(axs, transition_graphs()):
+        pos = dict(positions)  # Set the positions of the nodes
+        xs, ys = zip(*pos.values())
 
-        pos = nx.circular_layout(G)  # Set the positions of the nodes
+        ax.scatter(xs, ys, s=1000, c="white", edgecolors="black", zorder=2)
+        for node, edge in edges:
+            # A self-loop leaves the node to the upper right and re-enters from the upper left.
+            style = (
+                "arc,angleA=60,angleB=120,armA=35,armB=35,rad=10" if edge == node else "arc3,rad=0"
+            )
+            ax.annotate(
+                "",
+                xy=pos[edge],
+                xytext=pos[node],
+                arrowprops=dict(
+                    arrowstyle="-|>",
+                    mutation_scale=10,
+                    color="black",
+                    shrinkA=20,  # Keep the arrows clear of the node circles
+                    shrinkB=20,
+                    connectionstyle=style,
+                ),
+                zorder=1,
+            )
+        for node, (x, y) in positions:
+            ax.text(
+                x,
+                y,
+                node,
+                color="black",
+                fontsize=8,
+                fontweight="bold",
+                horizontalalignment="center",
+                verticalalignment="center",
+                zorder=3,
+            )  # Add node labels
 
-        nx.draw_networkx_nodes(
-            G, pos, node_size=1000, ax=axs[i], node_color="white", edgecolors="black"
+        # Leave room for the node circles and for self-loops above the top node.
+        ax.set_xlim(-1.4, 1.4)
+        ax.set_ylim(-1.4, 1.4)
+        ax.tick_params(
+            axis="both", which="both", bottom=False, left=False, labelbottom=False, labelleft=False
         )
-        nx.draw_networkx_edges(
-            G,
-            pos,
-            ax=axs[i],
-            edge_color="black",
-            arrows=True,
-            arrowsize=10,
-            min_source_margin=20,  # Adjust the value to make self-loops smaller
-            min_target_margin=20,  # Adjust the value to make self-loops smaller
-            connectionstyle="arc3,rad=0",
-        )  # Show arrow heads
-        nx.draw_networkx_labels(
-            G,
-            pos,
-            labels=nx.get_node_attributes(G, "label"),
-            ax=axs[i],
-            font_color="black",
-            font_size=8,
-            font_weight="bold",
-            verticalalignment="center",
-        )  # Add node labels
-        axs[i].set_title(transition.__class__.__name__)
-
-    plt.tight_layout()
-    backend(config=config, loglevel=loglevel, fig=fig)
+        ax.set_title(title)
+
+    # The 1x3 grid never changes, so fixed margins replace the text-measuring tight_layout pass.
+    fig.subplots_adjust(left=0.02, right=0.98, top=0.92, bottom=0.05, wspace=0.1)
+    return pickle.dumps(fig)
+
+
+def build_state_transition_figure():
+    """
+    Build the state transition figure.
+
+    Returns:
+        Figure: A new copy of the figure, which the caller may change freely.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    # The figure is drawn once per process; each call unpickles its own copy.
+    fig = pickle.loads(_pickled_state_transition_figure())
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def render_state_transitions(config, loglevel, backend):
+    """
+    Render the state transitions.
+
+    Args:
+        config (Config): The configuration object.
+        loglevel (int | str): The log level
+        backend (callable): The backend to use for rendering.
+    """
+    backend(config=config, loglevel=loglevel, fig=build_state_transition_figure())
 
 
 if __name__ == "__main__":
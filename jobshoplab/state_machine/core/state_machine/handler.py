@@ -71,14 +71,18 @@ def create_timed_machine_transitions(
             that need to transition to their next state
     """
     transitions = []
-    all_buffer_configs = buffer_type_utils.get_all_buffer_configs(instance)
+    # Idle machines have to be checked for setup every tick anyway, so the machines are always
+    # scanned; only the per-machine work is kept small.
+    now = state.time.time if isinstance(state.time, Time) else None
+    # Only needed once an idle machine has a job waiting, which most ticks do not have
+    all_buffer_configs = None
     # Check each machine to see if it's time to change its state
     for machine in state.machines:
 
         # Check for timed transitions (when occupation time is over)
         transition = None
-        if isinstance(machine.occupied_till, Time) and isinstance(state.time, Time):
-            if machine.occupied_till.time <= state.time.time:
+        if now is not None and isinstance(machine.occupied_till, Time):
+            if machine.occupied_till.time <= now:
                 # Create appropriate transition based on current machine state
                 match machine.state:
                     case MachineStateState.SETUP:
@@ -104,7 +108,13 @@ def create_timed_machine_transitions(
                         )
                     case _:
                         pass
-        if transition is None and machine.state == MachineStateState.IDLE:
+        if (
+            transition is None
+            and machine.state == MachineStateState.IDLE
+            and len(machine.prebuffer.store) > 0
+        ):
+            if all_buffer_configs is None:
+                all_buffer_configs = buffer_type_utils.get_all_buffer_configs(instance)
             transition = create_machine_setup_transition(
                 all_buffer_configs, machine
             )  # Create setup transition if applicable
@@ -350,6 +360,7 @@ def create_timed_transport_transitions(
             (this state is not yet implemented)
     """
     transitions = []
+    now = state.time.time if isinstance(state.time, Time) else None
 
     # Check each transport to see if it's time to change its state
     for transport in state.transports:
@@ -357,8 +368,8 @@ def create_timed_transport_transitions(
             transport, state, instance
         ):
             transitions.append(transport.occupied_till.transition)
-        if isinstance(transport.occupied_till, Time) and isinstance(state.time, Time):
-            if transport.occupied_till.time <= state.time.time:
+        if now is not None and isinstance(transport.occupied_till, Time):
+            if transport.occupied_till.time <= now:
                 # Create appropriate transition based on current transport state
                 match transport.state:
                     case TransportStateState.PICKUP | TransportStateState.WAITINGPICKUP:
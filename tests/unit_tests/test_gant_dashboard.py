@@ -0,0 +1,434 @@
+import gzip
+import json
+import pickle
+import socket
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from plotly import colors as plotly_colors
+
+from jobshoplab.env.rendering import gant_dashboard
+from jobshoplab.env.rendering.gant_dashboard import (
+    DashboardDataMapper,
+    DashboardUtils,
+    JobShopDashboard,
+)
+from jobshoplab.types.state_types import (
+    BufferState,
+    BufferStateState,
+    JobState,
+    NoTime,
+    OperationState,
+    OperationStateState,
+    Time,
+    TransportLocation,
+    TransportState,
+    TransportStateState,
+)
+
+
+def test_map_key_to_sort():
+    assert DashboardDataMapper.map_key_to_sort("j-3") == 3
+    assert DashboardDataMapper.map_key_to_sort("m-2") == 2
+    assert DashboardDataMapper.map_key_to_sort("t-1") == 1001
+    assert DashboardDataMapper.map_key_to_sort("b-1") == 2001
+    assert DashboardDataMapper.map_key_to_sort("x-1") == 0
+
+
+def test_map_key_to_sort_orders_components():
+    keys = ["b-0", "t-1", "m-2", "t-0", "m-0"]
+    assert sorted(keys, key=DashboardDataMapper.map_key_to_sort) == [
+        "m-0",
+        "m-2",
+        "t-0",
+        "t-1",
+        "b-0",
+    ]
+
+
+def _transport(id, location, occupied_till, job="j-0", state=TransportStateState.TRANSIT):
+    return TransportState(
+        state=state,
+        id=id,
+        occupied_till=Time(occupied_till),
+        buffer=BufferState(id=f"b-{id}", state=BufferStateState.EMPTY, store=()),
+        location=TransportLocation(progress=0.0, location=location),
+        outages=(),
+        transport_job=job,
+    )
+
+
+def test_make_transport_data_merges_consecutive_locations():
+    transports = [
+        (_transport("t-0", "m-0", 5), 1),
+        (_transport("t-0", "m-0", 6), 2),
+        (_transport("t-0", "m-1", 9), 6),
+        (_transport("t-1", "m-1", 4), 0),
+    ]
+    data = list(DashboardDataMapper.make_transport_data(transports))
+    assert [(d["id"], d["start"], d["end"]) for d in data] == [
+        ("t-0", 1, 6),
+        ("t-0", 6, 9),
+        ("t-1", 0, 4),
+    ]
+    assert data[0]["meta_info"] == "route: m-0"
+
+
+def test_make_transport_data_empty():
+    assert list(DashboardDataMapper.make_transport_data([])) == []
+
+
+def test_map_states_to_transport_data_skips_idle_and_sorts_by_transport():
+    idle = _transport("t-0", "m-0", 0, state=TransportStateState.IDLE)
+    history = (
+        SimpleNamespace(time=Time(0), transports=(_transport("t-1", "m-1", 4), idle)),
+        SimpleNamespace(time=Time(1), transports=(_transport("t-0", "m-0", 5),)),
+        SimpleNamespace(time=Time(5), transports=(_transport("t-0", "m-1", 9),)),
+    )
+    data = DashboardDataMapper.map_states_to_transport_data(history, 9)
+    assert [(d["id"], d["start"], d["end"]) for d in data] == [
+        ("t-0", 1, 5),
+        ("t-0", 5, 9),
+        ("t-1", 0, 4),
+    ]
+
+
+def test_iter_all_states_yields_sub_states_before_state():
+    history = (
+        SimpleNamespace(sub_states=("s-0", "s-1"), state="s-2"),
+        SimpleNamespace(sub_states=(), state="s-3"),
+    )
+    states = DashboardDataMapper.iter_all_states(history)
+
+    assert next(states) == "s-0"
+    assert list(states) == ["s-1", "s-2", "s-3"]
+    assert DashboardDataMapper.add_sub_states_to_history(history) == ("s-0", "s-1", "s-2", "s-3")
+
+
+def _operation(id, machine_id, state, start=None, end=None):
+    return OperationState(
+        id=id,
+        start_time=Time(start) if start is not None else NoTime(),
+        end_time=Time(end) if end is not None else NoTime(),
+        machine_id=machine_id,
+        operation_state_state=state,
+    )
+
+
+def test_map_states_to_schedule_data_appends_active_operation_last():
+    job = JobState(
+        id="j-0",
+        operations=(
+            _operation("o-0-0", "m-0", OperationStateState.DONE, 0, 3),
+            _operation("o-0-1", "m-1", OperationStateState.PROCESSING, 3, 7),
+            _operation("o-0-2", "m-2", OperationStateState.IDLE),
+        ),
+        location="m-1",
+    )
+    idle_job = JobState(
+        id="j-1",
+        operations=(_operation("o-1-0", "m-1", OperationStateState.IDLE),),
+        location="b-0",
+    )
+    state = SimpleNamespace(jobs=(job, idle_job))
+
+    data = DashboardDataMapper.map_states_to_schedule_data(state, 7)
+
+    assert [(d["job"], d["id"], d["start"], d["end"]) for d in data] == [
+        ("j-0", "m-0", 0, 3),
+        ("j-0", "m-1", 3, 7),
+    ]
+    assert all(d["type"] == "Schedule" for d in data)
+
+
+def test_get_color_mapping():
+    colors = DashboardDataMapper.get_color_mapping({"j-1", "m-0", "t-0", "b-2", "x-0"})
+    assert colors == {
+        "j-1": plotly_colors.qualitative.Plotly[1],
+        "m-0": plotly_colors.qualitative.Plotly[0],
+        "t-0": plotly_colors.colorbrewer.Greys[3],
+        "b-2": plotly_colors.colorbrewer.Greens[2],
+    }
+
+
+def test_make_hover_text():
+    schedule = {"type": "Schedule", "job": "j-0", "start": 0, "end": 3, "id": "m-1"}
+    transport = {
+        "type": "Transport",
+        "job": "j-0",
+        "start": 3,
+        "end": 5,
+        "id": "t-0",
+        "meta_info": "route: m-1",
+    }
+    assert (
+        DashboardDataMapper.make_hover_text(schedule)
+        == "Typ: Schedule<br>Job: j-0<br>Start: 0<br>End: 3<br>ID: m-1"
+    )
+    assert (
+        DashboardDataMapper.make_hover_text(transport)
+        == "Typ: Transport<br>Job: j-0<br>Start: 3<br>End: 5<br>Route: route: m-1"
+    )
+    assert DashboardDataMapper.make_hover_text({"type": "Buffer"}) == ""
+
+
+def test_get_latest_time_skips_unset_end_times():
+    job = JobState(
+        id="j-0",
+        operations=(
+            _operation("o-0-0", "m-0", OperationStateState.DONE, 0, 3),
+            _operation("o-0-1", "m-1", OperationStateState.PROCESSING, 3, 7),
+            _operation("o-0-2", "m-2", OperationStateState.IDLE),
+        ),
+        location="m-1",
+    )
+    assert DashboardDataMapper.get_latest_time(SimpleNamespace(jobs=(job,))) == 7
+
+
+def _gantt_rows():
+    return [
+        {"type": "Schedule", "job": "j-1", "id": "m-0", "start": 3, "end": 5, "meta_info": None},
+        {"type": "Schedule", "job": "j-0", "id": "m-0", "start": 0, "end": 3, "meta_info": None},
+        {"type": "Schedule", "job": "j-0", "id": "m-1", "start": 3, "end": 4, "meta_info": None},
+        {"type": "Transport", "job": "j-1", "id": "t-0", "start": 0, "end": 2, "meta_info": "m-0"},
+    ]
+
+
+def test_build_figure_groups_bars_per_legend_key():
+    fig = DashboardDataMapper.build_figure(_gantt_rows(), 4, axis=False)
+
+    assert [(t["name"], t["offsetgroup"]) for t in fig["data"]] == [
+        ("m-0", "Schedule"),
+        ("m-1", "Schedule"),
+        ("t-0", "Transport"),
+    ]
+    machine_0 = fig["data"][0]
+    assert list(machine_0["y"]) == ["j-0", "j-1"]
+    assert list(machine_0["base"]) == [0, 3]
+    assert list(machine_0["x"]) == [3, 2]
+    assert fig["layout"]["yaxis"]["categoryarray"] == ["j-0", "j-1"]
+    assert fig["layout"]["shapes"][0]["x0"] == 4
+
+
+def test_build_figure_shows_each_legend_key_once():
+    fig = DashboardDataMapper.build_figure(_gantt_rows(), 4, axis=True)
+
+    assert [(t["name"], t["showlegend"]) for t in fig["data"]] == [
+        ("j-0", True),
+        ("j-1", True),
+        ("j-1", False),
+    ]
+    assert fig["layout"]["yaxis"]["categoryarray"] == ["m-0", "m-1", "t-0"]
+
+
+def test_build_figure_template_is_optional():
+    assert "template" in DashboardDataMapper.build_figure(_gantt_rows(), 4, axis=False)["layout"]
+    fig = DashboardDataMapper.build_figure(_gantt_rows(), 4, axis=False, with_template=False)
+    assert "template" not in fig["layout"]
+    assert DashboardDataMapper.empty_figure(with_template=False)["layout"] == {}
+
+
+def test_db_round_trip():
+    data = {"schedules": _gantt_rows()[:3], "transports": _gantt_rows()[3:], "buffer": []}
+
+    file_bytes = DashboardUtils.dump_db(data, 2, 2, 5)
+
+    assert file_bytes.startswith(b"\x1f\x8b")
+    assert DashboardUtils.load_db(file_bytes) == (data, 2, 2, 5)
+    assert DashboardUtils.load_db(gzip.decompress(file_bytes)) == (data, 2, 2, 5)
+
+
+def test_load_db_rejects_legacy_pickle_files():
+    file_bytes = pickle.dumps(({}, 2, 2, 5), protocol=pickle.HIGHEST_PROTOCOL)
+
+    with pytest.raises(ValueError, match="legacy pickle"):
+        DashboardUtils.load_db(file_bytes)
+    with pytest.raises(ValueError, match="not a .lab file"):
+        DashboardUtils.load_db(gzip.compress(b"not json"))
+
+
+def test_build_figure_webgl_draws_line_segments():
+    fig = DashboardDataMapper.build_figure(_gantt_rows(), 4, axis=False, webgl=True)
+
+    machine_0 = fig["data"][0]
+    assert machine_0["type"] == "scattergl"
+    assert machine_0["x"].dtype == float
+    assert np.isnan(machine_0["x"][3::4]).all()
+    assert list(machine_0["x"][0::4]) == [0, 3]
+    assert list(machine_0["x"][1::4]) == [1.5, 4]
+    assert list(machine_0["x"][2::4]) == [3, 5]
+    assert list(machine_0["y"]) == ["j-0"] * 3 + [None] + ["j-1"] * 3 + [None]
+    assert list(machine_0["hovertext"][1::4]) == [
+        "Typ: Schedule<br>Job: j-0<br>Start: 0<br>End: 3<br>ID: m-0",
+        "Typ: Schedule<br>Job: j-1<br>Start: 3<br>End: 5<br>ID: m-0",
+    ]
+    assert set(machine_0["hovertext"][0::4]) | set(machine_0["hovertext"][2::4]) == {None}
+    # The two job rows share the plot height.
+    assert machine_0["line"]["width"] == int((800 - 180) / 2 * 0.7)
+
+
+def test_check_port_falls_back_to_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("localhost", 0))
+        s.listen()
+        taken = s.getsockname()[1]
+
+        port = DashboardUtils.check_port(taken)
+
+        assert port != taken
+        assert not DashboardUtils.is_port_in_use(port)
+
+
+def test_is_port_in_use_detects_wildcard_listener():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("", 0))
+        s.listen()
+
+        assert DashboardUtils.is_port_in_use(s.getsockname()[1])
+
+
+def test_query_rows_filters_and_sorts():
+    rows = tuple(_gantt_rows())
+    filter_model = {
+        "job": {"filterType": "text", "type": "equals", "filter": "J-0"},
+    }
+
+    result = DashboardUtils.query_rows(rows, [{"colId": "start", "sort": "desc"}], filter_model)
+
+    assert [(row["id"], row["start"]) for row in result] == [("m-1", 3), ("m-0", 0)]
+
+
+def test_query_rows_combined_number_filter():
+    rows = tuple(_gantt_rows())
+    filter_model = {
+        "end": {
+            "filterType": "number",
+            "operator": "OR",
+            "conditions": [
+                {"filterType": "number", "type": "lessThan", "filter": 3},
+                {"filterType": "number", "type": "inRange", "filter": 5, "filterTo": 6},
+            ],
+        },
+    }
+
+    result = DashboardUtils.query_rows(rows, [{"colId": "end", "sort": "asc"}], filter_model)
+
+    assert [row["end"] for row in result] == [2, 5]
+
+
+def test_matches_filter_text_conditions():
+    def text(kind, target=None):
+        return {"filterType": "text", "type": kind, "filter": target}
+
+    assert DashboardUtils.matches_filter("Route: M-0", text("contains", "m-0"))
+    assert not DashboardUtils.matches_filter("route: m-0", text("notContains", "M-0"))
+    assert DashboardUtils.matches_filter("j-10", text("startsWith", "j-1"))
+    assert not DashboardUtils.matches_filter("j-10", text("endsWith", "j-1"))
+    assert DashboardUtils.matches_filter("m-1", text("notEqual", "m-0"))
+    assert DashboardUtils.matches_filter(None, text("blank"))
+    assert not DashboardUtils.matches_filter("m-0", text("blank"))
+    assert DashboardUtils.matches_filter("m-0", text("notBlank"))
+
+
+def test_matches_filter_number_conditions():
+    def number(kind, target=None, target_to=None):
+        return {"filterType": "number", "type": kind, "filter": target, "filterTo": target_to}
+
+    assert DashboardUtils.matches_filter(3, number("lessThanOrEqual", 3))
+    assert not DashboardUtils.matches_filter(3, number("lessThan", 3))
+    assert DashboardUtils.matches_filter(4, number("greaterThan", 3))
+    assert not DashboardUtils.matches_filter(None, number("equals", 3))
+    # Ranges include both bounds, matching inRangeInclusive on the grid columns.
+    assert DashboardUtils.matches_filter(3, number("inRange", 3, 5))
+    assert DashboardUtils.matches_filter(5, number("inRange", 3, 5))
+    assert not DashboardUtils.matches_filter(6, number("inRange", 3, 5))
+
+
+def test_matches_filter_ignores_unfilled_number_conditions():
+    half_range = {"filterType": "number", "type": "inRange", "filter": 3}
+
+    assert DashboardUtils.matches_filter(4, half_range)
+    assert not DashboardUtils.matches_filter(2, half_range)
+    assert DashboardUtils.matches_filter(2, {"filterType": "number", "type": "inRange"})
+    assert DashboardUtils.matches_filter(2, {"filterType": "number", "type": "lessThan"})
+
+
+def test_query_rows_combined_text_filter():
+    rows = tuple(_gantt_rows())
+    filter_model = {
+        "id": {
+            "filterType": "text",
+            "operator": "AND",
+            "conditions": [
+                {"filterType": "text", "type": "startsWith", "filter": "m-"},
+                {"filterType": "text", "type": "notEqual", "filter": "m-1"},
+            ],
+        },
+        "start": {"filterType": "number", "type": "greaterThan", "filter": 0},
+    }
+
+    result = DashboardUtils.query_rows(rows, [], filter_model)
+
+    assert [(row["id"], row["job"]) for row in result] == [("m-0", "j-1")]
+
+
+def test_rows_to_csv():
+    rows = _gantt_rows()[2:]
+
+    assert DashboardUtils.rows_to_csv(rows) == (
+        "type,id,job,start,end,meta_info\n" "Schedule,m-1,j-0,3,4,\n" "Transport,t-0,j-1,0,2,m-0\n"
+    )
+
+
+def test_has_transports_checks_transport_rows():
+    rows = _gantt_rows()
+
+    assert DashboardUtils.has_transports({"schedules": rows[:3], "transports": rows[3:]})
+    assert not DashboardUtils.has_transports({"schedules": rows[:3], "transports": []})
+    assert not DashboardUtils.has_transports({"schedules": rows[:3]})
+
+
+def test_get_rows_answers_each_query_from_its_own_rows():
+    dashboard = SimpleNamespace(rows=tuple(_gantt_rows()), table_cache=None)
+    by_start = {"startRow": 0, "endRow": 2, "sortModel": [{"colId": "start", "sort": "asc"}]}
+    by_end = {"startRow": 0, "endRow": 2, "sortModel": [{"colId": "end", "sort": "desc"}]}
+
+    first = JobShopDashboard.get_rows(dashboard, by_start)
+    second = JobShopDashboard.get_rows(dashboard, by_end)
+    again = JobShopDashboard.get_rows(dashboard, dict(by_end, startRow=2, endRow=4))
+
+    assert [row["start"] for row in first["rowData"]] == [0, 0]
+    assert [row["end"] for row in second["rowData"]] == [5, 4]
+    assert [row["end"] for row in again["rowData"]] == [3, 2]
+    assert first["rowCount"] == second["rowCount"] == 4
+
+
+def test_load_figures_sends_one_figure_per_kind_and_axis():
+    rows = _gantt_rows()
+    data = {"schedules": rows[:3], "transports": rows[3:], "buffer": []}
+    dashboard = JobShopDashboard(data, (2,), 2, 4, True, False, 8050)
+
+    parts = json.loads(dashboard.load_figures())
+
+    assert sorted(parts["figures"]) == ["schedules0", "schedules1", "transports0", "transports1"]
+    assert [t["name"] for t in parts["figures"]["transports0"]["data"]] == ["t-0"]
+    assert parts["categories"] == {"0": ["j-0", "j-1"], "1": ["m-0", "m-1", "t-0"]}
+    assert parts["legend"] == {"0": ["m-0", "m-1", "t-0"], "1": ["j-0", "j-1"]}
+    assert "template" not in parts["figures"]["schedules0"]["layout"]
+    assert dashboard.load_figures() is dashboard.figures_json
+
+
+def test_dashboard_picks_renderer_once_from_total_rows(monkeypatch):
+    monkeypatch.setattr(gant_dashboard, "WEBGL_BAR_THRESHOLD", 3)
+    rows = _gantt_rows()
+    data = {"schedules": rows[:3], "transports": rows[3:], "buffer": []}
+
+    dashboard = JobShopDashboard(data, (2,), 2, 4, True, False, 8050)
+
+    # Three schedule bars alone stay below the threshold, but all figures use WebGL.
+    assert dashboard.use_webgl is True
+    assert (
+        dashboard.update_fig(data, 4, False, True, False, False)["data"][0]["type"] == "scattergl"
+    )
+    assert not JobShopDashboard(data, (2,), 2, 4, True, False, 8050, use_webgl=False).use_webgl
@@ -0,0 +1,47 @@
+import numpy as np
+
+from jobshoplab.env.rendering.state_transitions_rendering import (
+    build_state_transition_figure,
+    circular_positions,
+    transition_graphs,
+)
+from jobshoplab.state_machine.core.transitions import StateEnum
+
+
+def test_circular_positions_start_at_one_and_go_counterclockwise():
+    pos = circular_positions(["a", "b", "c", "d"])
+
+    assert list(pos) == ["a", "b", "c", "d"]
+    assert np.allclose([pos["a"], pos["b"], pos["c"], pos["d"]], [(1, 0), (0, 1), (-1, 0), (0, -1)])
+
+
+def test_transition_graphs_are_immutable():
+    graphs = transition_graphs()
+
+    assert [title for title, _, _ in graphs] == [
+        "BufferTransition",
+        "TransportTransition",
+        "MachineTransition",
+    ]
+    for _, positions, edges in graphs:
+        assert isinstance(positions, tuple) and isinstance(edges, tuple)
+    machine_edges = graphs[2][2]
+    assert (StateEnum.RUNNING, StateEnum.RUNNING) in machine_edges
+
+
+def _pixels(fig):
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba()).copy()
+
+
+def test_build_state_transition_figure_returns_independent_figures():
+    first = build_state_transition_figure()
+    second = build_state_transition_figure()
+    expected = _pixels(second)
+
+    # A backend changing its figure must not affect later renders.
+    first.suptitle("changed")
+    first.set_size_inches(4, 2)
+
+    assert first is not second
+    assert np.array_equal(_pixels(build_state_transition_figure()), expected)